@@ -1,8 +1,67 @@
 import json
-from typing import Any, Dict, Optional, Union
+import re
+from functools import cached_property
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 from http.server import BaseHTTPRequestHandler
 
+try:
+    # Optional: orjson serializes straight to bytes and parses bytes several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+# A run of 19 or more digits may be an integer orjson cannot hold exactly, it would parse it as a float
+digits: Pattern = re.compile(rb"\d{19}")
+
+
+def encode(data: Any, compact: bool = False, newline: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, with orjson when it is installed.
+
+    Data orjson cannot encode, such as integers beyond 64 bits, is handed to json instead.
+    NaN and infinite floats are the one difference: orjson writes them as null.
+
+    Args:
+        data (Any): The JSON-serializable data.
+        compact (bool): Drop the spaces json puts after separators; orjson output is always compact.
+        newline (bool): End the document with a newline, as socket frames do.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        # Non-string keys are converted as json does; orjson writes the newline into its own buffer
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+        try:
+            return orjson.dumps(data, option=option)  # orjson returns bytes, no separate encode step
+        except TypeError:
+            pass
+    document = json.dumps(data, separators=(",", ":") if compact else None).encode("utf-8")
+    return document + b"\n" if newline else document
+
+
+def decode(data: bytes) -> Any:
+    """
+    Parse UTF-8 encoded JSON, giving the same result with or without orjson installed.
+
+    Args:
+        data (bytes): The encoded JSON document.
+
+    Returns:
+        Any: The parsed data.
+
+    Raises:
+        ValueError: If the data is not valid UTF-8 encoded JSON.
+    """
+    if orjson is not None and not digits.search(data):
+        try:
+            return orjson.loads(data)  # Parse the UTF-8 bytes directly, no intermediate string
+        except ValueError:
+            pass  # NaN, Infinity or invalid JSON: let json accept the former and report the latter
+    return json.loads(data.decode("utf-8"))  # Decode binary data to a UTF-8 string and parse as JSON
+
+
 class Request:
     """
     A Request object to encapsulate details of an HTTP request.
@@ -56,10 +115,10 @@ class Request:
         """
         return self.parsing.fragment  # Access the fragment component of the parsed URL
 
-    @property
+    @cached_property
     def headers(self) -> Dict[str, str]:
         """
-        Get the request headers.
+        Get the request headers, converted to a dictionary on first access and reused afterwards.
 
         Returns:
             dict: A dictionary of request headers.
@@ -83,15 +142,16 @@ class Request:
         Returns:
             Optional[dict]: The JSON data parsed from the request body, or None if no data is present.
         """
-        # Convert headers to a dictionary and retrieve 'Content-Length', defaulting to 0
-        content = int(dict(self.handler.headers).get("Content-Length", 0))
+        # Read 'Content-Length' straight from the parsed headers, defaulting to 0
+        content = int(self.handler.headers.get("Content-Length", 0))
 
         # Read and parse JSON data only if content length is non-zero
         if content:
             data = self.handler.rfile.read(content)  # Read binary data from the request body
-            return json.loads(data.decode("utf-8"))  # Decode binary data to a UTF-8 string and parse as JSON
+            return decode(data)
         return None  # Return None if no JSON data is present
 
+
 class Response:
     """
     A Response object to encapsulate details of an HTTP response.
@@ -101,8 +161,19 @@ class Response:
         status (int): The HTTP status code for the response.
         headers (dict): A dictionary of response headers.
         body (bytes): The response body in bytes.
+        replies (Dict[str, Callable]): Builders of the api() response content and status code, keyed by HTTP method.
     """
 
+    # Response content and status code for each HTTP method, built once instead of on every api() call
+    replies: Dict[str, Callable[[Optional[Dict[str, Any]]], Tuple[Dict[str, Any], int]]] = {
+        "GET": lambda data: (data if data is not None else {}, 200),
+        "POST": lambda data: (
+            {"message": "Resource created", "data": data} if data else {"message": "Resource created"}, 201),
+        "PUT": lambda data: (
+            {"message": "Resource updated", "data": data} if data else {"message": "Resource updated"}, 200),
+        "DELETE": lambda data: ({"message": "Resource deleted"}, 204),
+    }
+
     def __init__(self, handler: BaseHTTPRequestHandler) -> None:
         """
         Initialize a Response object.
@@ -135,7 +206,7 @@ class Response:
             data (dict): The JSON data to be included in the response body.
         """
         self.headers["Content-Type"] = "application/json"  # Set the header to indicate JSON content
-        self.body = json.dumps(data).encode("utf-8")  # Encode JSON data to bytes
+        self.body = encode(data)  # Encode JSON data to bytes
         self.send()  # Send the response with the JSON body
 
     def api(self, data: Optional[Dict[str, Any]] = None) -> None:
@@ -149,19 +220,10 @@ class Response:
         """
         method = self.handler.command  # Retrieve the HTTP method (e.g., "GET", "POST")
 
-        # Define the response content and status code based on HTTP method
-        context = {
-            "GET": lambda: (data if data is not None else {}, 200),
-            "POST": lambda: (
-                {"message": "Resource created", "data": data} if data else {"message": "Resource created"}, 201),
-            "PUT": lambda: (
-                {"message": "Resource updated", "data": data} if data else {"message": "Resource updated"}, 200),
-            "DELETE": lambda: ({"message": "Resource deleted"}, 204),
-        }
-
         # Fetch response and status using the method's handler or default to 405 if method not allowed
-        response, status = context.get(method, lambda: ({"error": "Method not allowed"}, 405))()
+        reply = self.replies.get(method)
+        response, status = reply(data) if reply is not None else ({"error": "Method not allowed"}, 405)
         self.status = status  # Set the determined status code
         self.headers["Content-Type"] = "application/json"  # Set content type to JSON
-        self.body = json.dumps(response).encode("utf-8")  # Encode response data to JSON format in bytes
+        self.body = encode(response)  # Encode response data to JSON format in bytes
         self.send()  # Send the response back to the client
\ No newline at end of file
@@ -1,12 +1,87 @@
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Any, Type
-from jinja2 import Environment, FileSystemLoader
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Optional, Any, Type
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+from appdirs import user_cache_dir
 from router import Router
 from broadcast import Request, Response
+import hashlib
 import ssl
+import logging
 import warnings
 
+# Per-request failures go through logging, which only formats the message when the level is enabled
+logger = logging.getLogger(__name__)
+
+
+class TemplateCache(FileSystemBytecodeCache):
+    """
+    On-disk cache for compiled template bytecode in the user's cache directory,
+    so templates are not recompiled from source after every restart.
+
+    Jinja keys cached templates by their name and loader path, which are relative to the
+    working directory, so each project gets its own subdirectory named after a hash of its
+    resolved template root. Two projects with a "templates/index.html" never share a file.
+
+    The directory is only created when a template is first compiled, so importing
+    WebPy or running an app without templates never touches the filesystem.
+
+    Attributes:
+        enabled (bool): Cleared once the directory turns out to be unwritable, templates are then compiled from source.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Point the cache at the project's subdirectory of the user's cache directory without creating it.
+
+        Args:
+            root (Path): The template directory the cache belongs to.
+        """
+        project = hashlib.sha1(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+        super().__init__(str(Path(user_cache_dir("WebPy"), "templates", project)))
+        self.enabled = True
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """
+        Load cached bytecode, if any; a missing cache directory simply means nothing is cached yet.
+
+        Args:
+            bucket (Bucket): The bucket to fill with the cached template.
+        """
+        if not self.enabled:
+            return
+        try:
+            super().load_bytecode(bucket)
+        except OSError as error:
+            self.disable(error)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """
+        Store compiled bytecode, creating the cache directory on first use.
+
+        Args:
+            bucket (Bucket): The bucket holding the compiled template.
+        """
+        if not self.enabled:
+            return
+        try:
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError as error:
+            self.disable(error)
+
+    def disable(self, error: OSError) -> None:
+        """
+        Stop using the cache after a filesystem error, warning once.
+
+        Args:
+            error (OSError): The error raised by the cache directory.
+        """
+        self.enabled = False
+        warnings.warn(f"Template bytecode cache disabled: {error}")
+
 
 class WebPyCore(BaseHTTPRequestHandler):
     """
@@ -14,8 +89,9 @@ class WebPyCore(BaseHTTPRequestHandler):
     static file serving, and customizable error handling for web applications.
     """
 
-    # Jinja2 environment for rendering HTML templates from the "templates" directory
-    template_env = Environment(loader=FileSystemLoader(Path("templates")))
+    # Jinja2 environment for rendering HTML templates from the "templates" directory, shared by
+    # every request so compiled templates stay in its cache, with bytecode persisted across restarts
+    template_env = Environment(loader=FileSystemLoader(Path("templates")), bytecode_cache=TemplateCache(Path("templates")))
 
     # Directory containing static files (e.g., CSS, JS, images)
     static_env = Path("static")
@@ -31,8 +107,8 @@ class WebPyCore(BaseHTTPRequestHandler):
         ".woff2": "font/woff2", ".ttf": "font/ttf",
     }
 
-    # Stores custom error handlers for specific HTTP status codes
-    errors: Dict[int, Callable[[Optional[Request], Response], None]] = {}
+    # Stores custom error handlers for specific HTTP status codes (read-only once the server runs)
+    errors: Mapping[int, Callable[[Optional[Request], Response], None]] = {}
 
     def do_GET(self):
         """Handle HTTP GET requests by calling the generic serve_http_request method."""
@@ -51,26 +127,19 @@ class WebPyCore(BaseHTTPRequestHandler):
         self.serve_http_request("DELETE")
 
     @classmethod
-    def route(cls, path: str, methods: Optional[List[str]] = None) -> Callable:
+    def route(cls, path: str, methods: Optional[Iterable[str]] = None) -> Callable:
         """
         Decorator for registering HTTP routes with specific paths and methods.
 
         Args:
             path (str): URL path pattern to register for the route.
-            methods (Optional[List[str]]): Allowed HTTP methods (e.g., GET, POST).
+            methods (Optional[Iterable[str]]): Allowed HTTP methods (e.g., GET, POST).
 
         Returns:
             Callable: The handler function decorated with routing capabilities.
         """
-        if methods is None:
-            methods = ["GET"]
-
-        def decorator(handler: Callable) -> Callable:
-            # Register the handler with the Router for the specified path and methods
-            Router.route(path, methods)(handler)
-            return handler
-
-        return decorator
+        # Hand out the Router's decorator directly; it registers the handler and returns it
+        return Router.route(path, methods)
 
     @classmethod
     def error(cls, code: int) -> Callable:
@@ -118,7 +187,7 @@ class WebPyCore(BaseHTTPRequestHandler):
                 self.serve(404, "Not Found")
         except Exception as error:
             # Handle internal errors (500) for exceptions
-            self.serve(500, f"Internal Server Error: {str(error)}")
+            self.serve(500, f"Internal Server Error: {error}")
 
     def serve_static_files(self, path: str) -> None:
         """
@@ -140,7 +209,7 @@ class WebPyCore(BaseHTTPRequestHandler):
         except FileNotFoundError:
             self.serve(404, "File Not Found")
         except Exception as error:
-            warnings.warn(f"Error serving static file {path}: {error}")
+            logger.warning("Error serving static file %s: %s", path, error)
             self.serve(500, "Internal Server Error")
 
     @staticmethod
@@ -195,6 +264,11 @@ class WebPyCore(BaseHTTPRequestHandler):
         else:
             print(f"Starting HTTP server on {ip}:{port}")
 
+        # Registration is over once serving starts: freeze the route and error tables so no
+        # handler can mutate them mid-request
+        Router.freeze()
+        cls.errors = MappingProxyType(cls.errors)
+
         try:
             host.serve_forever()
         except OSError as error:
@@ -209,10 +283,10 @@ class WebPyCore(BaseHTTPRequestHandler):
             code (int): HTTP status code (e.g., 404 for Not Found).
             message (str): Error message to display in the response.
         """
-        if code in self.errors:
+        handler = self.errors.get(code)
+        if handler is not None:
             # Use registered custom error handler if available
             response = Response(self)
-            handler = self.errors[code]
             handler(None, response)  # Pass None for request in error cases
             response.send()
         else:
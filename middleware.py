@@ -1,13 +1,16 @@
-from typing import Callable, List, Any
+from typing import Callable, List, Any, TYPE_CHECKING
 from broadcast import Request, Response
 from functools import wraps
-from webpy import WebPy
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it eagerly pulls in the whole server stack
+    from webpy import WebPy
 
 
 class Middleware:
     """Middleware class to manage request/response processing handlers."""
 
-    def __init__(self, app: WebPy) -> None:
+    def __init__(self, app: "WebPy") -> None:
         """
         Initialize the Middleware with the given application.
 
@@ -42,10 +45,16 @@ class Middleware:
             Callable: The decorated function.
         """
         def decorator(handler: Callable) -> Callable:
+            # Resolve the pipeline once; the registered list is mutated in place,
+            # so objects registered after decoration are still picked up
+            pipeline = objects if objects is not None else self.objects
+
+            # An explicitly empty pipeline can never run anything, so skip the wrapper entirely
+            if objects is not None and not objects:
+                return handler
+
             @wraps(handler)
             def wrapper(request: Request, response: Response, *args, **kwargs):
-                # Run either specified objects or all registered objects
-                pipeline = objects if objects is not None else self.objects
                 for object in pipeline:
                     object(request, response)
                 return handler(request, response, *args, **kwargs)
@@ -1,37 +1,105 @@
 import re
-from typing import Callable, Dict, List, Optional, Union, Tuple, Pattern
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Union, Tuple, Pattern
+
+# Methods allowed when a route does not list any, shared by every such route
+DEFAULT_METHODS: FrozenSet[str] = frozenset({"GET"})
+
+
+class Node:
+    """
+    A node in the route trie, one level per path segment.
+
+    Attributes:
+        children (Dict[str, Node]): Child nodes for literal segments, keyed by the segment text.
+        params (Dict[str, Node]): Child nodes for dynamic segments, keyed by the parameter name.
+        routes (List[Dict[str, Any]]): The routes registered for the path ending at this node, in registration
+            order. Paths differing only in parameter types share a node, so one node may hold several routes.
+        first (int): The lowest registration index of any route at or below this node.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty node with no children and no routes."""
+        self.children: Dict[str, "Node"] = {}
+        self.params: Dict[str, "Node"] = {}
+        self.routes: List[Dict[str, Any]] = []
+        self.first: int = sys.maxsize
 
 
 class Router:
     """
     A simple router class that registers routes and matches them based on
-    the path and HTTP method using regular expressions.
+    the path and HTTP method.
+
+    Routes are stored in a trie keyed by path segment, so matching a request walks
+    one node per segment instead of testing every registered pattern. Paths the trie
+    cannot express (parameters mixed with literal text in one segment, or regular
+    expression syntax) are matched with their compiled regex instead.
+
+    When several routes match a request, the one registered first wins, whether it
+    lives in the trie or among the regex routes.
 
     Attributes:
-        routes (Dict[str, Dict[str, Union[Callable, List[str], Pattern]]]):
-            A dictionary to store routes, their handlers, allowed methods, and compiled regex patterns.
+        routes (Mapping[str, Dict[str, Union[Callable, FrozenSet[str], Pattern]]]):
+            A dictionary to store routes, their handlers, allowed methods, compiled regex patterns,
+            compiled trie segments and parameter positions (both None for regex-only routes).
+        tree (Node): Root of the trie holding every route made of whole literal or dynamic segments.
+        fallback (Mapping[str, Dict[str, Union[Callable, FrozenSet[str], Pattern]]]):
+            Routes that can only be matched through their regex pattern.
     """
-    routes: Dict[str, Dict[str, Union[Callable, List[str], Pattern]]] = {}
+    routes: Mapping[str, Dict[str, Union[Callable, FrozenSet[str], Pattern]]] = {}
+    tree: Node = Node()
+    fallback: Mapping[str, Dict[str, Union[Callable, FrozenSet[str], Pattern]]] = {}
+
+    # Kinds of compiled path segments: plain text, or a dynamic parameter capturing one segment
+    LITERAL = 0
+    PARAMETER = 1
+
+    # A dynamic parameter such as <id:int>, and the same token filling a whole path segment
+    token: Pattern = re.compile(r"<(\w+):(\w+)>")
+    parameter: Pattern = re.compile(r"^<(\w+):(\w+)>$")
+
+    # Characters that give a literal segment regex meaning, which the trie cannot reproduce.
+    # This includes ".", which matches any character in the route's regex (so "/robots.txt" matches "/robotsXtxt")
+    special: Pattern = re.compile(r"[\\^$*+?{}\[\]|().]")
 
     @classmethod
-    def route(cls, path: str, methods: Optional[List[str]] = None) -> Callable[[Callable], Callable]:
+    def route(cls, path: str, methods: Optional[Iterable[str]] = None) -> Callable[[Callable], Callable]:
         """
         Decorator to register a route with an optional list of HTTP methods.
 
         Args:
             path (str): The route path, potentially including dynamic segments (e.g., "/user/<id:int>").
-            methods (Optional[List[str]]): The list of allowed HTTP methods for the route. Defaults to ["GET"].
+            methods (Optional[Iterable[str]]): The allowed HTTP methods for the route, or a single method name.
+                Defaults to GET only.
 
         Returns:
             Callable[[Callable], Callable]: A decorator function that registers the handler for the route.
         """
+        # Store methods as a frozenset for O(1) checks at dispatch, sharing the default when none are given.
+        # A single method passed as a string is one method, not a set of its letters
         if methods is None:
-            methods = ["GET"]  # Default to GET if no methods are provided
+            methods = DEFAULT_METHODS
+        elif isinstance(methods, str):
+            methods = frozenset((methods,))
+        else:
+            methods = frozenset(methods)
 
         # Convert dynamic path segments like <id:int> to regex patterns for parameter extraction
-        pattern = re.sub(r"<(\w+):(\w+)>", r"(?P<\1>[^/]+)", path)
+        pattern = cls.token.sub(r"(?P<\1>[^/]+)", path)
         regex: Pattern = re.compile(f"^{pattern}$")  # Compile the pattern into a regex
 
+        # Parse the path into trie segments once, at registration rather than per request
+        segments = cls.compile(path)
+
+        # Name and position of every dynamic segment, so a trie match reads its parameters
+        # straight out of the split request path
+        params = None
+        if segments is not None:
+            params = tuple((text, position) for position, (kind, text) in enumerate(segments)
+                           if kind == cls.PARAMETER)
+
         def decorator(handler: Callable) -> Callable:
             """
             Registers the route by associating the path with the handler,
@@ -43,16 +111,146 @@ class Router:
             Returns:
                 Callable: The original handler function.
             """
+            # A path registered again replaces its previous route, as assigning to the routes dictionary does,
+            # and keeps its place in the registration order
+            previous = cls.routes.get(path)
+            index = previous["index"] if previous is not None else len(cls.routes)
+
             # Store the route details: handler, allowed methods, and compiled regex pattern
-            cls.routes[path] = {
+            route = cls.routes[path] = {
                 "handler": handler,
                 "methods": methods,
-                "pattern": regex
+                "pattern": regex,
+                "segments": segments,
+                "params": params,
+                "index": index
             }
+
+            # Index the route in the trie, or keep it for regex matching if the trie cannot express it
+            if segments is None:
+                cls.fallback[path] = route
+            else:
+                cls.insert(segments, route, previous)
             return handler  # Return the original handler function
 
         return decorator
 
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Make the route tables read-only once the server has started.
+
+        Registering a route afterwards raises TypeError instead of silently
+        changing routing while requests are being served.
+        """
+        cls.routes = MappingProxyType(cls.routes)
+        cls.fallback = MappingProxyType(cls.fallback)
+
+    @classmethod
+    def compile(cls, path: str) -> Optional[Tuple[Tuple[int, str], ...]]:
+        """
+        Parse a route path into the segments stored in the trie.
+
+        Args:
+            path (str): The route path.
+
+        Returns:
+            Optional[Tuple[Tuple[int, str], ...]]:
+                One (kind, text) pair per "/"-separated segment, where text is the literal segment
+                or the parameter name. None if the path can only be matched as a regex.
+        """
+        segments = []
+        for segment in path.split("/"):
+            match = cls.parameter.match(segment)
+            if match:
+                segments.append((cls.PARAMETER, match.group(1)))
+            elif cls.token.search(segment) or cls.special.search(segment):
+                # Segments such as "<name:str>.txt" or "item-(\d+)" only work as regular expressions
+                return None
+            else:
+                segments.append((cls.LITERAL, segment))
+        return tuple(segments)
+
+    @classmethod
+    def insert(cls, segments: Tuple[Tuple[int, str], ...], route: Dict[str, Any],
+               previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add a route to the trie, creating one node per compiled path segment.
+
+        Args:
+            segments (Tuple[Tuple[int, str], ...]): The compiled path segments.
+            route (Dict[str, Any]): The route details to store at the final node.
+            previous (Optional[Dict[str, Any]]): The route previously registered for the same path, replaced in place.
+        """
+        node = cls.tree
+        node.first = min(node.first, route["index"])
+        for kind, text in segments:
+            if kind == cls.PARAMETER:
+                # Dynamic segment: branch on the parameter name so differently named routes stay apart
+                node = node.params.setdefault(text, Node())
+            else:
+                node = node.children.setdefault(text, Node())
+            # Record the earliest route below each node, letting lookups skip subtrees that cannot win
+            node.first = min(node.first, route["index"])
+
+        if previous in node.routes:
+            node.routes[node.routes.index(previous)] = route
+        else:
+            node.routes.append(route)
+
+    @classmethod
+    def find(cls, segments: List[str], method: str) -> Optional[Dict[str, Any]]:
+        """
+        Walk the trie for a split request path and return the earliest registered route matching it.
+
+        A dynamic segment may match where a literal one also does, so every alternative is
+        explored; subtrees holding only routes registered after the best match so far are skipped.
+        The walk is iterative: alternatives still to try are kept on an explicit stack,
+        so deep paths cost no Python call frame per segment.
+
+        Args:
+            segments (List[str]): The request path split on "/".
+            method (str): The HTTP method of the request.
+
+        Returns:
+            Optional[Dict[str, Any]]: The matching route, or None if nothing matches.
+        """
+        depth = len(segments)
+        best: Optional[Dict[str, Any]] = None
+
+        # Each entry is a node to resume from and the index of its next segment
+        stack: List[Tuple[Node, int]] = [(cls.tree, 0)]
+
+        while stack:
+            node, index = stack.pop()
+
+            # Nothing below this node was registered before the best match found so far
+            if best is not None and node.first > best["index"]:
+                continue
+
+            if index == depth:
+                # Routes sharing this node are kept in registration order, each with its own methods
+                for route in node.routes:
+                    if method in route["methods"]:
+                        if best is None or route["index"] < best["index"]:
+                            best = route
+                        break
+                continue  # Backtrack to the next alternative
+
+            segment = segments[index]
+
+            # Dynamic segments match any non-empty segment, like the [^/]+ regex they replace
+            if segment:
+                for child in node.params.values():
+                    stack.append((child, index + 1))
+
+            # Literal segments are explored first, they usually lead straight to the match
+            child = node.children.get(segment)
+            if child is not None:
+                stack.append((child, index + 1))
+
+        return best
+
     @classmethod
     def match_route(cls, path: str, method: str) -> Optional[Tuple[Callable, Dict[str, str]]]:
         """
@@ -67,17 +265,28 @@ class Router:
                 If a match is found, returns a tuple of the route handler and a dictionary of extracted parameters.
                 If no match is found, returns None.
         """
-        # Iterate over all registered routes to find a matching path and method
-        for route in cls.routes.values():
-            pattern: Pattern = route.get("pattern")
-            allowed_methods = route.get("methods", ["GET"])  # Default to GET if no methods are specified
+        # Walk the trie first, it covers every route with plain segments
+        segments = path.split("/")
+        found = cls.find(segments, method)
+
+        # Iterate over the remaining regex-only routes, in registration order, to find a matching path and method
+        for route in cls.fallback.values():
+            # Routes registered after the trie match cannot take precedence over it
+            if found is not None and route["index"] > found["index"]:
+                break
+
+            # Check the method first, it is far cheaper than running the regex
+            if method not in route["methods"]:
+                continue
+
+            # Run the pattern once and reuse the match object for parameter extraction
+            match = route["pattern"].match(path)
+            if match:
+                return route["handler"], match.groupdict()  # Return the matched handler and extracted parameters
 
-            # Check if the route pattern matches the path and method is allowed
-            if pattern and pattern.match(path) and method in allowed_methods:
-                handler = route["handler"]
-                match = pattern.match(path)
-                params = match.groupdict() if match else {}  # Extract parameters from the path if present
-                return handler, params  # Return the matched handler and extracted parameters
+        if found is not None:
+            # Parameters are only gathered for the route that matched, from positions known at registration
+            return found["handler"], {name: segments[position] for name, position in found["params"]}
 
         return None  # Return None if no match is found
 
@@ -96,6 +305,6 @@ class Router:
         for route in cls.routes.values():
             pattern: Pattern = route.get("pattern")
             if pattern and pattern.match(path):
-                return route.get("methods", ["GET"])  # Return the allowed methods for the route
+                return sorted(route["methods"])  # Return the allowed methods for the route
 
         return ["GET"]  # Default to "GET" if no match is found
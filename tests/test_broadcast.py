@@ -0,0 +1,96 @@
+import json
+import unittest
+from typing import Any
+from unittest import mock
+
+import broadcast
+from broadcast import decode, encode
+
+
+class JsonTest(unittest.TestCase):
+    """
+    encode and decode must give the same results with orjson as with the json module,
+    which is what they used before orjson became an optional speed-up.
+    """
+
+    documents = [
+        b'{"a": 1, "b": [1.5, true, false, null], "c": {"d": "\\u00e9\\ud83d\\ude00"}}',
+        "{\"text\": \"é中\"}".encode("utf-8"),
+        b"[12345678901234567890, -9223372036854775809, 9223372036854775807, -9223372036854775808]",
+        b'{"id": "1234567890123456789"}',
+        b"[NaN, Infinity, -Infinity, 1e400, 0.1, -0.0, 1E5]",
+        b'{"a": 1, "a": 2}',
+        b' \t\r\n[ ] ',
+        b'"text"',
+    ]
+
+    invalid = [b"", b"nope", b"{'a': 1}", b'{"a": 1}x', b"[1,]", b"\xef\xbb\xbf{}", b'"\xff"', b"\x00"]
+
+    values = [
+        {"a": [1, 2.5, None, True, False], "b": {"c": "é\U0001f600"}},
+        {1: "int", 2.5: "float", None: "none", False: "bool", "s": "str"},
+        {"big": 2 ** 70, "negative": -(2 ** 64), "max": 2 ** 63 - 1},
+        [[], {}, "", 0, -1, 1e16, 0.1],
+    ]
+
+    def setUp(self) -> None:
+        if broadcast.orjson is None:
+            self.skipTest("orjson is not installed")
+
+    def without(self, function, *args, **kwargs) -> Any:
+        """
+        Call a function with orjson hidden, so only the json module is used.
+
+        Args:
+            function: The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The function's result.
+        """
+        with mock.patch.object(broadcast, "orjson", None):
+            return function(*args, **kwargs)
+
+    def test_decode_matches_json(self) -> None:
+        for document in self.documents:
+            with self.subTest(document=document):
+                # repr tells NaN, -0.0 and int from float apart, which == does not
+                self.assertEqual(repr(decode(document)), repr(self.without(decode, document)))
+                self.assertEqual(repr(decode(document)), repr(json.loads(document.decode("utf-8"))))
+
+    def test_decode_rejects_what_json_rejects(self) -> None:
+        for document in self.invalid:
+            with self.subTest(document=document):
+                with self.assertRaises(ValueError):
+                    decode(document)
+                with self.assertRaises(ValueError):
+                    self.without(decode, document)
+
+    def test_encode_matches_json(self) -> None:
+        for value in self.values:
+            for compact in (False, True):
+                with self.subTest(value=value, compact=compact):
+                    fast = encode(value, compact=compact)
+                    plain = self.without(encode, value, compact=compact)
+                    self.assertEqual(json.loads(fast), json.loads(plain))
+                    self.assertEqual(json.loads(plain), json.loads(json.dumps(value)))
+
+    def test_encode_newline(self) -> None:
+        for value in self.values:
+            with self.subTest(value=value):
+                fast = encode(value, compact=True, newline=True)
+                plain = self.without(encode, value, compact=True, newline=True)
+                self.assertEqual(fast.count(b"\n"), 1)
+                self.assertEqual(plain.count(b"\n"), 1)
+                self.assertTrue(fast.endswith(b"\n"))
+                self.assertTrue(plain.endswith(b"\n"))
+                self.assertEqual(json.loads(fast), json.loads(plain))
+
+    def test_compact_json_has_no_padding(self) -> None:
+        self.assertEqual(self.without(encode, {"a": [1, 2]}, compact=True), b'{"a":[1,2]}')
+        self.assertEqual(self.without(encode, {"a": [1, 2]}), b'{"a": [1, 2]}')
+
+
+if __name__ == "__main__":
+    unittest.main()
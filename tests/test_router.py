@@ -0,0 +1,171 @@
+import unittest
+from typing import Callable, Dict, Optional, Tuple
+
+from router import Node, Router
+
+
+def handler(name: str) -> Callable:
+    """
+    Create a named route handler, so matches can be compared by name.
+
+    Args:
+        name (str): The name given to the handler.
+
+    Returns:
+        Callable: A handler whose __name__ is the given name.
+    """
+    def route(*args, **kwargs) -> None:
+        pass
+
+    route.__name__ = name
+    return route
+
+
+class RouterTest(unittest.TestCase):
+    """
+    Route matching must pick the same handler as a linear scan over the routes in
+    registration order, the way the router matched before it used a trie.
+    """
+
+    def setUp(self) -> None:
+        """Start every test from empty route tables."""
+        Router.routes = {}
+        Router.tree = Node()
+        Router.fallback = {}
+
+    def register(self, path: str, name: str, methods=None) -> None:
+        """
+        Register a named handler for a path.
+
+        Args:
+            path (str): The route path.
+            name (str): The name of the handler.
+            methods: The allowed HTTP methods, or None for the default.
+        """
+        Router.route(path, methods)(handler(name))
+
+    def match(self, path: str, method: str = "GET") -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Match a request and return the handler name and parameters.
+
+        Args:
+            path (str): The request path.
+            method (str): The HTTP method of the request.
+
+        Returns:
+            Optional[Tuple[str, Dict[str, str]]]: The handler name and parameters, or None if nothing matches.
+        """
+        found = Router.match_route(path, method)
+        return (found[0].__name__, found[1]) if found else None
+
+    def scan(self, path: str, method: str = "GET") -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Reference matcher: the first registered route whose regex and methods both match.
+
+        Args:
+            path (str): The request path.
+            method (str): The HTTP method of the request.
+
+        Returns:
+            Optional[Tuple[str, Dict[str, str]]]: The handler name and parameters, or None if nothing matches.
+        """
+        for route in Router.routes.values():
+            match = route["pattern"].match(path)
+            if match and method in route["methods"]:
+                return route["handler"].__name__, match.groupdict()
+        return None
+
+    def test_same_node_routes_keep_their_methods(self) -> None:
+        self.register("/users/<id:int>", "get")
+        self.register("/users/<id:str>", "post", ["POST"])
+        self.assertEqual(self.match("/users/5"), ("get", {"id": "5"}))
+        self.assertEqual(self.match("/users/5", "POST"), ("post", {"id": "5"}))
+        self.assertIsNone(self.match("/users/5", "PUT"))
+
+    def test_regex_route_registered_first_wins(self) -> None:
+        self.register("/files/<name:str>.txt", "text")
+        self.register("/files/<name:str>", "file")
+        self.assertEqual(self.match("/files/a.txt"), ("text", {"name": "a"}))
+        self.assertEqual(self.match("/files/a.csv"), ("file", {"name": "a.csv"}))
+
+    def test_plain_route_registered_first_wins(self) -> None:
+        self.register("/files/<name:str>", "file")
+        self.register("/files/<name:str>.txt", "text")
+        self.assertEqual(self.match("/files/a.txt"), ("file", {"name": "a.txt"}))
+
+    def test_parameter_registered_before_literal_wins(self) -> None:
+        self.register("/users/<id:int>", "user")
+        self.register("/users/me", "me")
+        self.assertEqual(self.match("/users/me"), ("user", {"id": "me"}))
+
+    def test_literal_registered_before_parameter_wins(self) -> None:
+        self.register("/users/me", "me")
+        self.register("/users/<id:int>", "user")
+        self.assertEqual(self.match("/users/me"), ("me", {}))
+        self.assertEqual(self.match("/users/7"), ("user", {"id": "7"}))
+
+    def test_backtracks_from_literal_dead_end(self) -> None:
+        self.register("/a/lit/c", "literal")
+        self.register("/a/<x:str>/b", "parameter")
+        self.assertEqual(self.match("/a/lit/b"), ("parameter", {"x": "lit"}))
+        self.assertEqual(self.match("/a/lit/c"), ("literal", {}))
+
+    def test_backtracks_on_method(self) -> None:
+        self.register("/m/lit", "put", ["PUT"])
+        self.register("/m/<y:str>", "get")
+        self.assertEqual(self.match("/m/lit"), ("get", {"y": "lit"}))
+        self.assertEqual(self.match("/m/lit", "PUT"), ("put", {}))
+
+    def test_parameters_do_not_match_empty_segments(self) -> None:
+        self.register("/users/<id:int>", "user")
+        self.assertIsNone(self.match("/users/"))
+        self.assertIsNone(self.match("/users/5/"))
+
+    def test_reregistered_path_keeps_its_position(self) -> None:
+        self.register("/users/<id:int>", "old")
+        self.register("/users/me", "me")
+        self.register("/users/<id:int>", "new")
+        self.assertEqual(self.match("/users/me"), ("new", {"id": "me"}))
+
+    def test_single_method_string(self) -> None:
+        self.register("/submit", "submit", "POST")
+        self.assertEqual(self.match("/submit", "POST"), ("submit", {}))
+        self.assertIsNone(self.match("/submit", "P"))
+        self.assertEqual(Router.get_allowed_methods("/submit"), ["POST"])
+
+    def test_dot_in_literal_matches_any_character(self) -> None:
+        self.register("/robots.txt", "robots")
+        self.assertEqual(self.match("/robots.txt"), ("robots", {}))
+        self.assertEqual(self.match("/robotsXtxt"), ("robots", {}))
+        self.assertEqual(Router.get_allowed_methods("/robotsXtxt"), ["GET"])
+
+    def test_matches_linear_scan(self) -> None:
+        routes = [
+            ("/", "root", None),
+            ("/users/<id:int>", "user", None),
+            ("/users/me", "me", ["POST"]),
+            ("/users/<id:int>/posts/<pid:int>", "post", None),
+            ("/files/<name:str>.txt", "text", None),
+            ("/re/item-(\\d+)", "regex", None),
+            ("/a/<x:str>/b", "axb", None),
+            ("/a/lit/c", "alitc", None),
+            ("/m/<y:str>", "put", ["PUT"]),
+            ("/m/<z:str>", "get", ["GET", "POST"]),
+            ("/<any:str>/posts/<pid:int>", "any", None),
+            ("/robots.txt", "robots", None),
+            ("/v1.0/<id:int>", "versioned", None),
+        ]
+        for path, name, methods in routes:
+            self.register(path, name, methods)
+
+        requests = ["/", "/users/5", "/users/me", "/users/1/posts/2", "/x/posts/2", "/files/readme.txt",
+                    "/re/item-42", "/re/item-x", "/a/lit/b", "/a/lit/c", "/users/", "/users", "/m/q",
+                    "/nope", "/users/5/", "/robots.txt", "/robotsXtxt", "/v1.0/5", "/v1x0/5"]
+        for path in requests:
+            for method in ("GET", "POST", "PUT"):
+                with self.subTest(path=path, method=method):
+                    self.assertEqual(self.match(path, method), self.scan(path, method))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import socket
+import threading
+import time
+import unittest
+from typing import Any, List
+from unittest import mock
+
+from broadcast import decode
+from websocket import Socket
+
+
+def free_port() -> int:
+    """
+    Find a port on the loopback interface that nothing is listening on.
+
+    Returns:
+        int: The port number.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class SocketTest(unittest.TestCase):
+    """
+    Runs the server on a loopback port and talks to it through plain TCP clients. Every
+    client sends "ping" frames, which the server answers with a "pong" frame carrying the
+    same data, so a reply proves every frame sent before it was handled.
+    """
+
+    limit = 4
+    size = 1048576
+
+    def setUp(self) -> None:
+        """Start a server in a background thread and wait until it accepts connections."""
+        self.socket = Socket(None, limit=self.limit, size=self.size)
+        self.handled: List[Any] = []
+        self.clients: List[socket.socket] = []
+
+        @self.socket.on("ping")
+        def ping(data: Any, conn: socket.socket) -> None:
+            self.handled.append(data)
+            conn.sendall(self.socket.encode("pong", data))
+
+        self.port = free_port()
+        self.server = threading.Thread(target=self.socket.run, kwargs={"port": self.port}, daemon=True)
+        with mock.patch("builtins.print"):
+            self.server.start()
+            # The waker is set once the server listens
+            deadline = time.monotonic() + 5
+            while self.socket.waker is None:
+                self.assertLess(time.monotonic(), deadline, "server did not start")
+                time.sleep(0.01)
+
+    def tearDown(self) -> None:
+        """Stop the server and close every client."""
+        self.socket.stop()
+        self.server.join(5)
+        for client in self.clients:
+            client.close()
+
+    def connect(self) -> socket.socket:
+        """
+        Open a client connection to the server.
+
+        Returns:
+            socket.socket: The connected client.
+        """
+        client = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+        self.clients.append(client)
+        return client
+
+    def receive(self, client: socket.socket) -> Any:
+        """
+        Read one frame from the server.
+
+        Args:
+            client (socket.socket): The client to read from.
+
+        Returns:
+            Any: The parsed frame.
+        """
+        frame = bytearray()
+        while not frame.endswith(b"\n"):
+            data = client.recv(1)
+            self.assertTrue(data, "server closed the connection")
+            frame += data
+        return decode(bytes(frame))
+
+    def ping(self, client: socket.socket, data: Any) -> None:
+        """
+        Send a ping and check that the matching pong comes back.
+
+        Args:
+            client (socket.socket): The client to ping from.
+            data (Any): The data carried by the ping.
+        """
+        client.sendall(self.socket.encode("ping", data))
+        self.assertEqual(self.receive(client), {"event": "pong", "data": data})
+
+    def closed(self, client: socket.socket) -> bool:
+        """
+        Check whether the server closed a connection.
+
+        Args:
+            client (socket.socket): The client to check.
+
+        Returns:
+            bool: True if the connection was closed or reset.
+        """
+        try:
+            return client.recv(1) == b""
+        except ConnectionResetError:
+            return True
+
+    def test_split_frame(self) -> None:
+        client = self.connect()
+        client.sendall(b'{"event":"pi')
+        time.sleep(0.05)
+        client.sendall(b'ng","data":1}\n')
+        self.assertEqual(self.receive(client), {"event": "pong", "data": 1})
+
+    def test_coalesced_frames(self) -> None:
+        client = self.connect()
+        client.sendall(b'{"event":"ping","data":1}\n{"event":"ping","data":2}\n{"event":"pi')
+        self.assertEqual(self.receive(client), {"event": "pong", "data": 1})
+        self.assertEqual(self.receive(client), {"event": "pong", "data": 2})
+        client.sendall(b'ng","data":3}\n')
+        self.assertEqual(self.receive(client), {"event": "pong", "data": 3})
+
+    def test_blank_lines_are_skipped(self) -> None:
+        client = self.connect()
+        client.sendall(b'\n\r\n  \n{"event":"ping","data":1}\n')
+        self.assertEqual(self.receive(client), {"event": "pong", "data": 1})
+        self.assertEqual(self.handled, [1])
+
+    def test_invalid_and_non_object_frames_keep_the_connection(self) -> None:
+        client = self.connect()
+        with self.assertLogs("websocket", "WARNING") as logs:
+            client.sendall(b'nope\n[1, 2]\n"text"\n\xef\xbb\xbf{"event":"ping","data":0}\n')
+            self.ping(client, 1)
+        self.assertEqual(len(logs.records), 4)
+        self.assertEqual(self.handled, [1])
+
+    def test_unknown_event_is_ignored(self) -> None:
+        client = self.connect()
+        client.sendall(b'{"event":"other","data":1}\n{"data":2}\n')
+        self.ping(client, 3)
+        self.assertEqual(self.handled, [3])
+
+    def test_wake_never_blocks(self) -> None:
+        client = self.connect()
+        # Far more wake-ups than the pair can buffer: the extra ones are dropped, not waited on
+        for _ in range(100000):
+            self.socket.wake()
+        self.ping(client, 1)
+
+    def test_wake_after_stop(self) -> None:
+        self.socket.stop()
+        self.server.join(5)
+        self.assertFalse(self.server.is_alive())
+        self.assertIsNone(self.socket.waker)
+        self.socket.wake()
+        with self.assertRaises(ConnectionRefusedError):
+            socket.create_connection(("127.0.0.1", self.port), timeout=5).close()
+
+
+class SocketLimitTest(SocketTest):
+    """The same server with a single client slot and a 64 byte frame limit."""
+
+    limit = 1
+    size = 64
+
+    def test_queued_client_waits_for_a_slot(self) -> None:
+        first = self.connect()
+        self.ping(first, 1)
+
+        # The second client sits in the listen backlog while the only slot is taken
+        second = self.connect()
+        second.sendall(self.socket.encode("ping", 2))
+        second.settimeout(0.3)
+        with self.assertRaises(socket.timeout):
+            second.recv(1)
+        self.assertEqual(self.handled, [1])
+
+        # Freeing the slot wakes the accept loop, which picks the queued client up
+        first.close()
+        second.settimeout(5)
+        self.assertEqual(self.receive(second), {"event": "pong", "data": 2})
+
+    def test_stop_with_every_slot_taken(self) -> None:
+        client = self.connect()
+        self.ping(client, 1)
+
+        self.socket.stop()
+        self.server.join(5)
+        self.assertFalse(self.server.is_alive())
+
+        # Connected clients are left to finish
+        self.ping(client, 2)
+
+    def test_complete_frame_over_size_disconnects(self) -> None:
+        client = self.connect()
+        with self.assertLogs("websocket", "WARNING"):
+            client.sendall(self.socket.encode("ping", "x" * 64))
+            self.assertTrue(self.closed(client))
+        self.assertEqual(self.handled, [])
+
+    def test_partial_frame_over_size_disconnects(self) -> None:
+        client = self.connect()
+        with self.assertLogs("websocket", "WARNING"):
+            client.sendall(b"x" * 65)
+            self.assertTrue(self.closed(client))
+
+    def test_frame_at_size_is_accepted(self) -> None:
+        client = self.connect()
+        # The limit counts the frame without its newline
+        data = "x" * (65 - len(self.socket.encode("ping", "x")) + 1)
+        self.assertEqual(len(self.socket.encode("ping", data)), 65)
+        self.ping(client, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-from typing import Callable, List, Optional, Dict, Any, Type
+from typing import Callable, Iterable, Optional, Dict, Any, Type
 from core import WebPyCore
 
 
@@ -6,27 +6,25 @@ class WebPy:
     def __init__(self) -> None:
         """Initialize WebPyCore as part of the WebPy app."""
         self.app: Type[WebPyCore] = WebPyCore
+        # Bind the core entry points once so each call skips the class attribute lookup
+        self._route = WebPyCore.route
+        self._error = WebPyCore.error
+        self._render = WebPyCore.render
+        self._run = WebPyCore.run
 
-    def route(self, path: str, methods: Optional[List[str]] = None) -> Callable[[Callable], Callable]:
+    def route(self, path: str, methods: Optional[Iterable[str]] = None) -> Callable[[Callable], Callable]:
         """
         Decorator to register routes for specific paths and methods.
 
         Args:
             path (str): URL path for the route.
-            methods (Optional[List[str]]): HTTP methods allowed for this route. Defaults to ["GET"].
+            methods (Optional[Iterable[str]]): HTTP methods allowed for this route. Defaults to GET only.
 
         Returns:
             Callable: Decorated handler function.
         """
-        if methods is None:
-            methods = ["GET"]
-
-        def decorator(handler: Callable) -> Callable:
-            """Registers the route with WebPyCore."""
-            self.app.route(path, methods)(handler)
-            return handler
-
-        return decorator
+        # WebPyCore's decorator registers the handler and returns it unchanged
+        return self._route(path, methods)
 
     def error(self, code: int) -> Callable[[Callable], Callable]:
         """
@@ -38,12 +36,8 @@ class WebPy:
         Returns:
             Callable: Decorated error handler function.
         """
-        def decorator(handler: Callable) -> Callable:
-            """Registers the error handler with WebPyCore."""
-            self.app.error(code)(handler)
-            return handler
-
-        return decorator
+        # WebPyCore's decorator registers the handler and returns it unchanged
+        return self._error(code)
 
     def render(self, filename: str, **kwargs: Dict[str, Any]) -> str:
         """
@@ -56,7 +50,7 @@ class WebPy:
         Returns:
             str: Rendered HTML content.
         """
-        return self.app.render(filename, **kwargs)
+        return self._render(filename, **kwargs)
 
     def run(self, ip: Optional[str] = "127.0.0.1", port: Optional[int] = 8080,
             certfile: Optional[str] = None, keyfile: Optional[str] = None) -> None:
@@ -69,4 +63,4 @@ class WebPy:
             certfile (Optional[str]): Path to the SSL certificate file.
             keyfile (Optional[str]): Path to the SSL key file.
         """
-        self.app.run(ip=ip, port=port, certfile=certfile, keyfile=keyfile)
+        self._run(ip=ip, port=port, certfile=certfile, keyfile=keyfile)
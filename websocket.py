@@ -1,7 +1,13 @@
 import socket
+import selectors
 import threading
-import json
-from typing import Callable, Dict, Any, Optional, List
+import logging
+import warnings
+from typing import Callable, Dict, Any, Iterable, Optional, List, Set, Tuple
+from broadcast import encode, decode
+
+# Per-connection events go through logging, which skips formatting and output entirely when the level is disabled
+logger = logging.getLogger(__name__)
 
 
 class Socket:
@@ -10,17 +16,33 @@ class Socket:
     and real-time message handling similar to Socket.IO.
     """
 
-    def __init__(self, app: Any):
+    def __init__(self, app: Any, limit: int = 256, size: int = 1048576):
         """
         Initialize the Socket class with an app instance.
         Args:
             app: Application instance with which to register socket connections.
+            limit (int): Maximum number of clients served at once; further clients wait in the listen backlog.
+            size (int): Maximum size in bytes of one incoming frame; clients sending larger frames are disconnected.
         """
         self.app = app
-        # List to store all active client connections
-        self.connections: List[socket.socket] = []
+        # Caps the receive buffer of each client, which otherwise grows until a newline arrives
+        self.size = size
+        # Bounds the number of client threads, one slot per connection being served
+        self.slots = threading.BoundedSemaphore(limit)
+        # Set of all active client connections, giving O(1) membership and removal
+        self.connections: Set[socket.socket] = set()
+        # Immutable snapshot of the connections for broadcasts to iterate, rebuilt whenever the set changes
+        self.clients: Tuple[socket.socket, ...] = ()
+        # Serializes changes to the connection registry across client threads
+        self.lock = threading.Lock()
         # Dictionary to store event handlers, mapping event names to functions
         self.events: Dict[str, Callable[[Any, Any], None]] = {}
+        # Frames encoded ahead of time for events whose data never changes, keyed by event name
+        self.frames: Dict[str, bytes] = {}
+        # Write end of the pair that wakes the accept loop, set while the server runs
+        self.waker: Optional[socket.socket] = None
+        # Cleared by stop to end the accept loop
+        self.running = False
 
     def on(self, event: str) -> Callable:
         """
@@ -52,17 +74,104 @@ class Socket:
             event_name (str): The name of the event to emit.
             data (Optional[Dict[str, Any]]): Data to send with the event.
         """
-        # Create a message in JSON format containing the event and its associated data
-        message = json.dumps({"event": event_name, "data": data or {}})
+        # Serialize and encode the message once, every client receives the same bytes
+        self.broadcast(self.encode(event_name, data))
+
+    def emit_many(self, events: List[Tuple[str, Optional[Dict[str, Any]]]]) -> None:
+        """
+        Emit several events to all connected clients in a single write per client.
+        Args:
+            events (List[Tuple[str, Optional[Dict[str, Any]]]]): Event name and data pairs, in send order.
+        """
+        # Encode every frame once and join them, so each client costs one sendall instead of one per event
+        message = b"".join(self.encode(event_name, data) for event_name, data in events)
+        self.broadcast(message)
+
+    def prepare(self, event_name: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Encode an event with constant data once, so sending it later costs no serialization.
+        Useful for greetings sent on every connect and for heartbeats.
+        Args:
+            event_name (str): The name of the event.
+            data (Optional[Dict[str, Any]]): Data to send with the event.
+        """
+        self.frames[event_name] = self.encode(event_name, data)
 
-        # Send the message to all connected clients
-        for connection in self.connections:
+    def send(self, conn: socket.socket, event_name: str) -> None:
+        """
+        Send a frame registered with prepare to a single client.
+        Args:
+            conn (socket.socket): Client connection socket.
+            event_name (str): The name of the prepared event.
+        """
+        conn.sendall(self.frames[event_name])
+
+    def publish(self, event_name: str) -> None:
+        """
+        Send a frame registered with prepare to all connected clients.
+        Args:
+            event_name (str): The name of the prepared event.
+        """
+        # Straight to the fan-out loop: no frame is built or encoded per call
+        self.broadcast(self.frames[event_name])
+
+    @staticmethod
+    def encode(event_name: str, data: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Encode an event as a newline-terminated JSON frame.
+        With orjson installed, NaN and infinite floats are encoded as null.
+        Args:
+            event_name (str): The name of the event.
+            data (Optional[Dict[str, Any]]): Data to send with the event.
+        Returns:
+            bytes: The UTF-8 encoded frame, ending with a newline delimiter.
+        """
+        # Compact separators keep frames small, the newline is the frame delimiter
+        return encode({"event": event_name, "data": data or {}}, compact=True, newline=True)
+
+    def broadcast(self, message: bytes) -> None:
+        """
+        Send already encoded bytes to all connected clients, dropping broken connections.
+        Args:
+            message (bytes): The encoded payload to send.
+        """
+        # Collect broken connections instead of mutating the registry while iterating it
+        dead = []
+
+        # Send the message to all connected clients. The snapshot tuple is never mutated, so client
+        # threads may connect or disconnect concurrently, but a socket in it may be closed meanwhile
+        for connection in self.clients:
             try:
                 # Send message to the client
-                connection.sendall(message.encode("utf-8"))
-            except BrokenPipeError:
-                # If the connection is broken, remove the client
-                self.connections.remove(connection)
+                connection.sendall(message)
+            except OSError:
+                # Broken pipes, resets and sockets closed by their client thread all mean the client
+                # is gone; mark it for removal and keep sending to the others
+                dead.append(connection)
+
+        # Drop all broken clients in one pass
+        if dead:
+            self.detach(dead)
+
+    def attach(self, conn: socket.socket) -> None:
+        """
+        Add a client to the connection registry.
+        Args:
+            conn (socket.socket): Client connection socket.
+        """
+        with self.lock:
+            self.connections.add(conn)
+            self.clients = self.clients + (conn,)
+
+    def detach(self, conns: Iterable[socket.socket]) -> None:
+        """
+        Remove clients from the connection registry, ignoring any already removed.
+        Args:
+            conns (Iterable[socket.socket]): Client connection sockets to remove.
+        """
+        with self.lock:
+            self.connections.difference_update(conns)
+            self.clients = tuple(client for client in self.clients if client in self.connections)
 
     def connection(self, conn: socket.socket, addr: tuple) -> None:
         """
@@ -71,57 +180,217 @@ class Socket:
             conn (socket.socket): Client connection socket.
             addr (tuple): Address of the connected client.
         """
-        # Add the client connection to the list of active connections
-        self.connections.append(conn)
-        print(f"Connected to {addr}")
+        # Add the client connection to the active connections
+        self.attach(conn)
+        logger.info("Connected to %s", addr)
+
+        # Accumulates received bytes until complete newline-terminated frames are available,
+        # since TCP may split one frame across reads or deliver several in one read
+        buffer = bytearray()
+        # Receive area allocated once per connection and reused for every read, sliced through a view without copying
+        chunk = bytearray(65536)
+        view = memoryview(chunk)
+        # Local aliases for the handler table and frame limit, avoiding an attribute lookup per message
+        events = self.events
+        size = self.size
 
         try:
             while True:
-                # Receive messages from the client, decode them as UTF-8
-                message = conn.recv(1024).decode("utf-8")
+                # Receive as much as is available in one call to keep syscalls per frame low
+                received = conn.recv_into(chunk)
 
-                # If no message is received, exit the loop
-                if not message:
+                # If no data is received, the client closed the connection
+                if not received:
                     break
 
-                # Parse the received JSON message
-                content = json.loads(message)
-                # Get the event name and data from the message
-                event = content.get("event")
-                data = content.get("data")
-
-                # If the event is registered, call its handler with the data and connection
-                if event in self.events:
-                    self.events[event](data, conn)
-        except ConnectionResetError:
-            # Handle client disconnection
-            pass
+                # Bytes already held were searched on earlier reads and hold no delimiter, so the
+                # search resumes at the new data instead of rescanning a long partial frame
+                offset = len(buffer)
+                buffer += view[:received]
+
+                # Dispatch every complete frame currently held in the buffer, walking it by offset
+                # so the unconsumed tail is not copied again after each frame
+                start = 0
+                while True:
+                    index = buffer.find(b"\n", offset)
+                    if index == -1:
+                        break
+                    if index - start > size:
+                        logger.warning("Frame from %s exceeds %d bytes, disconnecting", addr, size)
+                        return
+                    message = buffer[start:index]
+                    offset = start = index + 1
+
+                    # Skip blank lines such as keep-alive newlines
+                    if not message.strip():
+                        continue
+
+                    # Parse the received JSON message straight from the UTF-8 bytes
+                    try:
+                        content = decode(message)
+                    except ValueError:
+                        # Both json and orjson decode errors are ValueErrors; skip the frame, keep the connection
+                        logger.warning("Invalid frame from %s", addr)
+                        continue
+
+                    # Valid JSON that is not an object, such as an array, carries no event name
+                    if not isinstance(content, dict):
+                        logger.warning("Invalid frame from %s", addr)
+                        continue
+
+                    # Look the handler up once; if the event is registered, call it with the data and connection
+                    handler = events.get(content.get("event"))
+                    if handler is not None:
+                        handler(content.get("data"), conn)
+
+                # Drop all consumed frames in one step, keeping only a trailing partial frame
+                del buffer[:start]
+
+                # A partial frame already past the limit can never be accepted, stop buffering it
+                if len(buffer) > size:
+                    logger.warning("Frame from %s exceeds %d bytes, disconnecting", addr, size)
+                    return
+        except OSError as error:
+            # The connection broke rather than closing cleanly: a reset, a keepalive timeout for a
+            # vanished peer, or a handler's send to a dead client
+            logger.info("Connection to %s lost: %s", addr, error)
         finally:
-            print(f"Disconnected from {addr}")
-            # Remove the client from active connections
-            self.connections.remove(conn)
+            logger.info("Disconnected from %s", addr)
+            # Remove the client from active connections; emit may already have dropped it
+            self.detach((conn,))
             conn.close()
 
-    def run(self, host: str = "127.0.0.1", port: int = 8081) -> None:
+    def run(self, host: str = "127.0.0.1", port: int = 8081, reuseport: bool = False) -> None:
         """
         Start the WebSocket server and listen for incoming connections.
         Args:
             host (str): Host IP address to bind the server.
             port (int): Port number to bind the server.
+            reuseport (bool): Let several processes bind the same port, with the kernel
+                spreading new connections across them. Each process only broadcasts to its own clients.
         """
+        # Set before anything else, so a stop arriving while the server starts up is not lost
+        self.running = True
+
         # Create a new socket for the server (IPv4, TCP)
         server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         # Allow address reuse for faster restarts
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Optionally share the port between processes, where the platform supports it
+        if reuseport:
+            if hasattr(socket, "SO_REUSEPORT"):
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            else:
+                warnings.warn("SO_REUSEPORT is not supported on this platform.", UserWarning)
         # Bind the server to the specified host and port
         server.bind((host, port))
-        # Start listening for incoming connections (with a backlog of 5)
-        server.listen(5)
+        # Start listening with the largest backlog the system allows, so connection bursts queue
+        # instead of being refused (Linux caps this at /proc/sys/net/core/somaxconn)
+        server.listen(socket.SOMAXCONN)
         print(f"WebSocket server running on ws://{host}:{port}")
 
-        # Continuously accept and handle incoming connections
-        while True:
-            # Accept new client connections
-            connection, address = server.accept()
-            # Start a new thread to manage the client connection
-            threading.Thread(target=self.connection, args=(connection, address)).start()
\ No newline at end of file
+        # Wait for incoming connections in the selector (epoll/kqueue where available) rather than a blocking accept
+        server.setblocking(False)
+        selector = selectors.DefaultSelector()
+        # A socket pair rather than os.pipe, since selectors on Windows only accept sockets; writing to
+        # one end wakes the selector when a slot is freed or stop is called
+        wakeup, waker = socket.socketpair()
+        # Waking never blocks the caller: a full pair already guarantees a pending wake-up
+        waker.setblocking(False)
+        self.waker = waker
+        selector.register(wakeup, selectors.EVENT_READ)
+
+        # Whether a slot is reserved for the next accepted connection. The listener is only watched
+        # while one is, so excess clients queue in the listen backlog while stop still gets through
+        held = False
+
+        try:
+            # Continuously accept and handle incoming connections
+            while self.running:
+                if not held:
+                    held = self.slots.acquire(blocking=False)
+                    if held:
+                        selector.register(server, selectors.EVENT_READ)
+
+                pending = False
+                for key, _ in selector.select():
+                    if key.fileobj is wakeup:
+                        # Consume the wake-ups, the loop re-checks slots and the running flag
+                        wakeup.recv(4096)
+                    else:
+                        pending = True
+
+                if not (pending and held and self.running):
+                    continue
+
+                # Drain every pending connection in one wake-up instead of one per select call
+                while True:
+                    try:
+                        # Accept new client connections
+                        connection, address = server.accept()
+                    except BlockingIOError:
+                        # The backlog is empty, keep the reserved slot for the next connection
+                        break
+                    try:
+                        # Client threads use blocking reads, whatever mode the accepted socket inherited
+                        connection.setblocking(True)
+                        # Send small frames immediately instead of waiting on Nagle's algorithm
+                        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                        # Let the kernel detect peers that vanished without closing the connection
+                        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                        # Start a daemon thread to manage the client connection, so stalled clients never block
+                        # shutdown; the thread owns the reserved slot from here on
+                        threading.Thread(target=self.serve, args=(connection, address), daemon=True).start()
+                    except (OSError, RuntimeError) as error:
+                        # One client failing setup, such as a peer that reset at once, must not stop the server;
+                        # the reserved slot stays with the loop for the next connection
+                        logger.warning("Could not set up connection from %s: %s", address, error)
+                        connection.close()
+                        continue
+                    # Reserve the next slot without waiting; with none free, stop watching the listener
+                    held = self.slots.acquire(blocking=False)
+                    if not held:
+                        selector.unregister(server)
+                        break
+        finally:
+            if held:
+                self.slots.release()
+            self.waker = None
+            waker.close()
+            wakeup.close()
+            selector.close()
+            server.close()
+
+    def stop(self) -> None:
+        """
+        Stop a running server: run stops accepting connections, closes the listening socket and returns.
+        Connected clients are left to finish.
+        """
+        self.running = False
+        self.wake()
+
+    def wake(self) -> None:
+        """
+        Wake the accept loop so it re-checks free slots and whether the server is stopping.
+        """
+        waker = self.waker
+        if waker is not None:
+            try:
+                waker.send(b"\0")
+            except OSError:
+                # A full pair already holds a pending wake-up, and a closed one means run has returned
+                pass
+
+    def serve(self, conn: socket.socket, addr: tuple) -> None:
+        """
+        Run a client connection and free its slot once it ends.
+        Args:
+            conn (socket.socket): Client connection socket.
+            addr (tuple): Address of the connected client.
+        """
+        try:
+            self.connection(conn, addr)
+        finally:
+            self.slots.release()
+            # The accept loop stops watching the listener while every slot is taken, tell it one is free
+            self.wake()
\ No newline at end of file